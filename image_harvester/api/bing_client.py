@@ -2,22 +2,69 @@
 Bing Image Search API client
 """
 
+import os
 import time
+import random
+import sqlite3
+import asyncio
+import threading
+import inspect
+import hashlib
+import functools
+import aiohttp
+import diskcache
+import orjson
 import requests
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Tuple, Iterator
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 
 from image_harvester.utils.logging import get_logger
-from image_harvester.utils.config import (
-    BING_SEARCH_API_KEY, 
-    BING_SEARCH_ENDPOINT,
-    DEFAULT_REQUEST_DELAY,
-    MAX_RETRY_ATTEMPTS
-)
+from image_harvester.utils.rate_limiter import TokenBucket
+from image_harvester.utils.config import get_config
 from image_harvester.api.models import SearchResult, ImageMetadata
 
 logger = get_logger(__name__)
 
+# Directory of the on-disk response cache
+CACHE_DIR = os.path.join('~', '.cache', 'image_harvester')
+
+# Longest Retry-After we honour, so a bad header can't stall a search for hours
+MAX_RETRY_AFTER = 60
+
+def _cached_response(func):
+    """
+    Cache the responses of a request method on disk, keyed by its parameters
+    
+    Works for both regular methods taking (params) and async methods taking
+    (session, params). Cached responses are returned without making the
+    request, so they don't count against the rate limit either. For async
+    methods the sqlite cache I/O runs in a worker thread, so it doesn't
+    block the event loop.
+    """
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(self, session, params):
+            # Don't leave the event loop when there is no cache to talk to
+            if not self._cache_enabled:
+                return await func(self, session, params)
+            
+            response_data = await asyncio.to_thread(self._get_cached_response, params)
+            if response_data is None:
+                response_data = await func(self, session, params)
+                await asyncio.to_thread(self._cache_response, params, response_data)
+            return response_data
+        return async_wrapper
+    
+    @functools.wraps(func)
+    def wrapper(self, params):
+        response_data = self._get_cached_response(params)
+        if response_data is None:
+            response_data = func(self, params)
+            self._cache_response(params, response_data)
+        return response_data
+    return wrapper
+
 class BingImageSearchClient:
     """Client for the Bing Image Search API"""
     
@@ -25,8 +72,9 @@ class BingImageSearchClient:
         self, 
         api_key: Optional[str] = None, 
         endpoint: Optional[str] = None,
-        request_delay: float = DEFAULT_REQUEST_DELAY,
-        max_retries: int = MAX_RETRY_ATTEMPTS
+        request_delay: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        cache_ttl: Optional[float] = None
     ):
         """
         Initialize the Bing Image Search client
@@ -34,16 +82,26 @@ class BingImageSearchClient:
         Args:
             api_key: The Bing Search API key (default: from config)
             endpoint: The Bing Search API endpoint (default: from config)
-            request_delay: Delay between requests in seconds
-            max_retries: Maximum number of retry attempts
+            request_delay: Average delay between requests in seconds, 0 disables
+                rate limiting (default: from config)
+            max_retries: Maximum number of retry attempts (default: from config)
+            cache_ttl: Seconds to keep responses in the on-disk cache, 0 disables
+                caching (default: from config)
         """
-        self.api_key = api_key or BING_SEARCH_API_KEY
-        self.endpoint = endpoint or BING_SEARCH_ENDPOINT
-        self.request_delay = request_delay
-        self.max_retries = max_retries
+        cfg = get_config()
+        self.api_key = api_key or cfg.bing_search_api_key
+        self.endpoint = endpoint or cfg.bing_search_endpoint
+        self.request_delay = cfg.default_request_delay if request_delay is None else request_delay
+        self.max_retries = cfg.max_retry_attempts if max_retries is None else max_retries
+        self.cache_ttl = cfg.bing_cache_ttl if cache_ttl is None else cache_ttl
         
-        # Remember the last request time to enforce rate limiting
-        self.last_request_time = 0
+        # Allow 1/request_delay requests per second with bursts of ~2 seconds' worth
+        self._bucket = None
+        if self.request_delay > 0:
+            self._bucket = TokenBucket(
+                rate=1 / self.request_delay,
+                capacity=max(1, int(2 / self.request_delay))
+            )
         
         if not self.api_key:
             logger.error("No API key provided. Set BING_SEARCH_API_KEY in .env file.")
@@ -52,6 +110,37 @@ class BingImageSearchClient:
         if not self.endpoint:
             logger.error("No API endpoint provided.")
             raise ValueError("No API endpoint provided")
+        
+        # Reuse connections across requests instead of paying a new TCP+TLS
+        # handshake for every page
+        self._session = requests.Session()
+        self._session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        self._session.headers.update({
+            'Ocp-Apim-Subscription-Key': self.api_key,
+            'Accept': 'application/json',
+            # Brotli decoding is provided by the brotli package
+            'Accept-Encoding': 'br, gzip, deflate'
+        })
+        
+        # Repeated searches are served from disk instead of the API. The cache
+        # is opened on first use, so clients that never search don't touch it
+        self._cache = None
+        self._cache_enabled = self.cache_ttl > 0
+        self._cache_lock = threading.Lock()
+    
+    def close(self):
+        """
+        Close the underlying HTTP session, its pooled connections and the cache
+        """
+        self._session.close()
+        if self._cache is not None:
+            self._cache.close()
+    
+    def __enter__(self) -> 'BingImageSearchClient':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def search(
         self, 
@@ -83,36 +172,13 @@ class BingImageSearchClient:
         Raises:
             RequestException: If the request fails
         """
-        # Enforce rate limiting
-        self._enforce_rate_limit()
-        
         # Build request parameters
-        params = {
-            'q': query,
-            'count': min(count, 150),  # Maximum allowed by Bing
-            'offset': offset,
-            'mkt': market,
-            'safeSearch': safe_search
-        }
-        
-        # Add optional parameters
-        if image_type:
-            params['imageType'] = image_type
-            
-        if filter:
-            params['$filter'] = filter
-            
-        # Add any additional parameters
-        params.update(kwargs)
-        
-        # Build headers
-        headers = {
-            'Ocp-Apim-Subscription-Key': self.api_key,
-            'Accept': 'application/json'
-        }
+        params = self._build_params(
+            query, count, offset, market, safe_search, image_type, filter, **kwargs
+        )
         
         # Make the request with retries
-        response_data = self._make_request_with_retries(params, headers)
+        response_data = self._make_request_with_retries(params)
         
         # Parse the response
         search_result = SearchResult.from_response(query, response_data)
@@ -129,79 +195,465 @@ class BingImageSearchClient:
         """
         Search for images and automatically handle pagination to get up to max_images
         
+        The number of images returned is also bounded by Bing's
+        totalEstimatedMatches for the query. This is a blocking wrapper
+        around search_all_async(), so it must not be called from a thread
+        that is already running an event loop.
+        
         Args:
             query: The search query
             max_images: Maximum number of images to return
-            **kwargs: Additional parameters to pass to search()
+            **kwargs: Additional parameters to pass to search_all_async()
             
         Returns:
             SearchResult: Combined search results
+            
+        Raises:
+            RequestException: If a page request fails
+        """
+        return asyncio.run(self.search_all_async(query, max_images, **kwargs))
+    
+    def iter_search(
+        self,
+        query: str,
+        max_images: int = 100,
+        **kwargs
+    ) -> Iterator[ImageMetadata]:
+        """
+        Search for images and yield them one page at a time, up to max_images
+        
+        Pages are requested sequentially, each starting at the nextOffset
+        returned with the previous page, and only when the consumer asks for
+        more images. Unlike search_all(), at most one page is held in memory.
+        
+        Args:
+            query: The search query
+            max_images: Maximum number of images to yield, also bounded by
+                Bing's totalEstimatedMatches
+            **kwargs: Additional parameters to pass to search()
+            
+        Yields:
+            ImageMetadata: The images in result order
         """
-        all_images = []
-        offset = 0
         count_per_request = min(150, max_images)  # Maximum allowed by Bing
+        offset = 0
+        yielded = 0
+        seen_urls = set()
         
-        while len(all_images) < max_images:
-            # Calculate how many more images we need
-            remaining = max_images - len(all_images)
-            current_count = min(remaining, count_per_request)
+        while yielded < max_images:
+            current_count = min(count_per_request, max_images - yielded)
             
-            # Make the search request
             logger.info(f"Searching for {current_count} images with offset {offset}...")
             result = self.search(query, count=current_count, offset=offset, **kwargs)
             
-            # Add the images to our collection
-            all_images.extend(result.images)
+            # Bing occasionally repeats images across pages, keep the first one
+            duplicates = 0
+            for image in result.images:
+                if yielded >= max_images:
+                    break
+                if image.content_url in seen_urls:
+                    duplicates += 1
+                    continue
+                seen_urls.add(image.content_url)
+                yielded += 1
+                yield image
             
-            # Check if we have more results
-            if not result.next_offset or not result.images:
-                # No more results available
-                logger.info(f"No more results available after {len(all_images)} images")
+            if duplicates:
+                logger.info(f"Skipped {duplicates} duplicate images at offset {offset}")
+            
+            # Stop as soon as the cursor doesn't move forward
+            if self._cursor_stalled(offset, result):
+                logger.info(f"No more results available after {yielded} images")
                 break
-                
-            # Update the offset for the next request
+            
             offset = result.next_offset
+    
+    async def search_all_async(
+        self,
+        query: str,
+        max_images: int = 100,
+        concurrency: int = 5,
+        **kwargs
+    ) -> SearchResult:
+        """
+        Search for images, fetching the remaining pages concurrently
+        
+        The first page is requested synchronously to learn the number of
+        estimated matches and the server's nextOffset cursor. The following
+        pages are fetched in batches of up to `concurrency` requests. Each
+        batch starts at the last nextOffset returned by the server, and the
+        later pages of the batch are spaced by how far the cursor moved on
+        the last page. A page is only kept if it starts exactly at the
+        nextOffset of the page before it. If Bing returns a page of a
+        different size, the rest of the batch is dropped and the next batch
+        starts from the real cursor. Pages are collected until max_images is
+        reached or a page comes back empty or its nextOffset fails to
+        advance.
+        
+        Args:
+            query: The search query
+            max_images: Maximum number of images to return, also bounded by
+                Bing's totalEstimatedMatches
+            concurrency: Maximum number of concurrent page requests
+            **kwargs: Additional parameters to pass to search()
+            
+        Returns:
+            SearchResult: Combined search results
+            
+        Raises:
+            RequestException: If a page request fails
+        """
+        count_per_request = min(150, max_images)  # Maximum allowed by Bing
+        
+        # The first page tells us how many results are available
+        logger.info(f"Searching for {count_per_request} images with offset 0...")
+        first_result = self.search(query, count=count_per_request, offset=0, **kwargs)
+        
+        # Bing occasionally repeats images across pages, keep the first one
+        all_images = []
+        seen_urls = set()
+        duplicates = self._extend_unique(all_images, first_result.images, seen_urls)
+        
+        # Fall back to max_images if Bing didn't report an estimate
+        available = min(max_images, first_result.total_estimated_matches or max_images)
+        
+        # The server cursor, how far it moved and how many images the last
+        # page held are used to predict the offsets of the next batch
+        stalled = self._cursor_stalled(0, first_result)
+        cursor = first_result.next_offset
+        step = cursor
+        per_page = len(first_result.images)
+        
+        if stalled or len(all_images) >= available:
+            # No more results available
+            logger.info(f"No more results available after {len(all_images)} images")
+        else:
+            semaphore = asyncio.BoundedSemaphore(concurrency)
+            connector = aiohttp.TCPConnector(limit=concurrency)
             
-            # Log progress
-            logger.info(f"Retrieved {len(all_images)}/{max_images} images...")
+            # Reuse the requests session headers as aiohttp session defaults
+            async with aiohttp.ClientSession(
+                connector=connector,
+                headers=dict(self._session.headers)
+            ) as session:
+                while not stalled and len(all_images) < available:
+                    remaining = available - len(all_images)
+                    batch_size = min(concurrency, -(-remaining // per_page))
+                    batch = [
+                        (cursor + i * step, min(count_per_request, remaining - i * per_page))
+                        for i in range(batch_size)
+                    ]
+                    
+                    logger.info(f"Fetching {len(batch)} more pages ({concurrency} at a time)...")
+                    pages = await asyncio.gather(*(
+                        self._fetch_page_async(
+                            session,
+                            semaphore,
+                            query,
+                            self._build_params(query, count=count, offset=offset, **kwargs)
+                        )
+                        for offset, count in batch
+                    ))
+                    
+                    # gather() preserves the order of the offsets. Only pages that
+                    # start exactly at the previous page's nextOffset are kept
+                    for (offset, _), page in zip(batch, pages):
+                        if offset != cursor:
+                            logger.debug(
+                                f"Page at offset {offset} doesn't follow nextOffset {cursor}, "
+                                f"refetching from the cursor"
+                            )
+                            break
+                        
+                        duplicates += self._extend_unique(all_images, page.images, seen_urls)
+                        
+                        # Stop at the first page where the cursor doesn't move forward
+                        if self._cursor_stalled(offset, page):
+                            logger.info(f"No more results available after {len(all_images)} images")
+                            stalled = True
+                            break
+                        
+                        step = page.next_offset - offset
+                        per_page = len(page.images)
+                        cursor = page.next_offset
+                        
+                        if len(all_images) >= available:
+                            break
+        
+        if duplicates:
+            logger.info(f"Skipped {duplicates} duplicate images for query: '{query}'")
         
         # Create a combined result
         combined_result = SearchResult(
             query=query,
             images=all_images[:max_images],  # Ensure we don't exceed max_images
-            total_estimated_matches=result.total_estimated_matches
+            total_estimated_matches=first_result.total_estimated_matches
         )
         
         logger.info(f"Retrieved a total of {len(combined_result.images)} images for query: '{query}'")
         return combined_result
     
+    async def _fetch_page_async(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.BoundedSemaphore,
+        query: str,
+        params: Dict[str, Any]
+    ) -> SearchResult:
+        """
+        Fetch and parse a single page of results once the semaphore allows it
+        
+        Args:
+            session: The aiohttp session to use
+            semaphore: Semaphore bounding the number of concurrent requests
+            query: The search query
+            params: Request parameters
+            
+        Returns:
+            SearchResult: The search results for this page
+        """
+        async with semaphore:
+            logger.info(f"Searching for {params['count']} images with offset {params['offset']}...")
+            response_data = await self._make_request_with_retries_async(session, params)
+        
+        search_result = SearchResult.from_response(query, response_data)
+        logger.info(f"Found {len(search_result.images)} images for query: '{query}'")
+        
+        return search_result
+    
+    def _cursor_stalled(self, offset: int, result: SearchResult) -> bool:
+        """
+        Check whether pagination should stop after a page
+        
+        Args:
+            offset: The offset the page was requested at
+            result: The page of results
+            
+        Returns:
+            bool: True if the page is empty or its nextOffset doesn't move
+                past offset
+        """
+        return not result.images or result.next_offset is None or result.next_offset <= offset
+    
+    def _extend_unique(
+        self,
+        all_images: List[ImageMetadata],
+        images: List[ImageMetadata],
+        seen_urls: set
+    ) -> int:
+        """
+        Append the images whose content URL hasn't been seen yet
+        
+        Args:
+            all_images: The list to append to
+            images: The images to append
+            seen_urls: Content URLs already in all_images, updated in place
+            
+        Returns:
+            int: Number of duplicate images that were skipped
+        """
+        duplicates = 0
+        for image in images:
+            if image.content_url in seen_urls:
+                duplicates += 1
+                continue
+            seen_urls.add(image.content_url)
+            all_images.append(image)
+        return duplicates
+    
+    def _build_params(
+        self,
+        query: str,
+        count: int = 50,
+        offset: int = 0,
+        market: str = 'en-US',
+        safe_search: str = 'Moderate',
+        image_type: Optional[str] = None,
+        filter: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Build the query parameters for a search request
+        
+        Values are converted to strings the way requests encodes them, so
+        the requests and aiohttp code paths send identical queries. Like
+        requests, parameters set to None are left out.
+        
+        Args:
+            See search()
+            
+        Returns:
+            Dict: The request parameters, all values as strings
+            
+        Raises:
+            TypeError: If an additional parameter is not a str, int or float
+        """
+        # Optional parameters are left out when they are None
+        params = {
+            key: value
+            for key, value in (
+                ('q', query),
+                ('count', min(count, 150)),  # Maximum allowed by Bing
+                ('offset', offset),
+                ('mkt', market),
+                ('safeSearch', safe_search),
+                ('imageType', image_type),
+                ('$filter', filter)
+            )
+            if value is not None
+        }
+        
+        # Add any additional parameters
+        for key, value in kwargs.items():
+            if value is None:
+                continue
+            if not isinstance(value, (str, int, float)):
+                raise TypeError(
+                    f"Unsupported type for query parameter '{key}': {type(value).__name__}"
+                )
+            params[key] = value
+        
+        return {key: str(value) for key, value in params.items()}
+    
     def _enforce_rate_limit(self):
         """
         Enforce rate limiting by delaying requests if necessary
         """
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
+        if self._bucket is None:
+            return
         
-        if time_since_last_request < self.request_delay:
-            # Wait the remaining time
-            wait_time = self.request_delay - time_since_last_request
-            logger.debug(f"Rate limiting: Waiting {wait_time:.2f} seconds")
-            time.sleep(wait_time)
+        wait_time = self._bucket.acquire()
+        if wait_time > 0:
+            logger.debug(f"Rate limiting: Waited {wait_time:.2f} seconds")
+    
+    def _reserve_request_slot(self) -> float:
+        """
+        Claim a request token without blocking
+        
+        The token is taken immediately, so concurrent callers queue up
+        behind each other instead of all waiting for the same token.
         
-        # Update the last request time
-        self.last_request_time = time.time()
+        Returns:
+            float: Seconds to wait before the request may be sent
+        """
+        if self._bucket is None:
+            return 0.0
+        return self._bucket.reserve()
+    
+    def _backoff_delay(
+        self,
+        attempt: int,
+        status_code: Optional[int] = None,
+        retry_after: Optional[str] = None
+    ) -> float:
+        """
+        Calculate how long to wait before retrying a failed request
+        
+        Uses exponential backoff with full jitter, so clients that failed at
+        the same time don't all retry at the same time. If the API answered
+        429 with a Retry-After header, that value is honoured instead, up to
+        MAX_RETRY_AFTER seconds.
+        
+        Args:
+            attempt: The number of the attempt that failed (starting at 1)
+            status_code: HTTP status code of the failed response (if any)
+            retry_after: Value of the Retry-After response header (if any)
+            
+        Returns:
+            float: Seconds to wait before the next attempt
+        """
+        # Exponential cap (1s, 2s, 4s, ... up to 30s)
+        cap = min(2 ** (attempt - 1), 30)
+        
+        if status_code == 429:
+            try:
+                delay = float(retry_after) if retry_after is not None else cap
+            except ValueError:
+                # Retry-After may also be an HTTP date, which we don't parse
+                delay = cap
+            delay = min(MAX_RETRY_AFTER, max(0.0, delay))
+            return delay + random.uniform(0, 1)
+        
+        return random.uniform(0, cap)
     
+    def _cache_key(self, params: Dict[str, Any]) -> str:
+        """
+        Build the cache key for a request
+        
+        The API key is part of the key material, so clients with different
+        subscriptions never share responses. Only the digest is stored.
+        
+        Args:
+            params: Request parameters
+            
+        Returns:
+            str: Hex digest identifying the API key, endpoint and parameters
+        """
+        return hashlib.blake2b(
+            orjson.dumps([self.api_key, self.endpoint, sorted(params.items())])
+        ).hexdigest()
+    
+    def _open_cache(self) -> Optional[diskcache.Cache]:
+        """
+        Open the response cache on first use
+        
+        If the cache directory can't be created or opened, a warning is logged
+        and the client carries on without a cache.
+        
+        Returns:
+            diskcache.Cache: The cache, or None if caching is disabled
+        """
+        if self._cache is None and self._cache_enabled:
+            with self._cache_lock:
+                if self._cache is None and self._cache_enabled:
+                    try:
+                        self._cache = diskcache.Cache(os.path.expanduser(CACHE_DIR))
+                    except (OSError, sqlite3.Error) as e:
+                        logger.warning(f"Could not open response cache at {CACHE_DIR}, caching disabled: {e}")
+                        self._cache_enabled = False
+        return self._cache
+    
+    def _get_cached_response(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response
+        
+        Args:
+            params: Request parameters
+            
+        Returns:
+            Dict: The cached response data, or None if not cached
+        """
+        cache = self._open_cache()
+        if cache is None:
+            return None
+        
+        response_data = cache.get(self._cache_key(params))
+        if response_data is not None:
+            logger.debug(f"Using cached response for offset {params.get('offset')}")
+        return response_data
+    
+    def _cache_response(self, params: Dict[str, Any], response_data: Dict[str, Any]):
+        """
+        Store a response in the cache
+        
+        Args:
+            params: Request parameters
+            response_data: The response data
+        """
+        cache = self._open_cache()
+        if cache is not None:
+            cache.set(self._cache_key(params), response_data, expire=self.cache_ttl)
+    
+    @_cached_response
     def _make_request_with_retries(
         self, 
-        params: Dict[str, Any], 
-        headers: Dict[str, str]
+        params: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
         Make a request to the Bing Image Search API with retries
         
         Args:
             params: Request parameters
-            headers: Request headers
             
         Returns:
             Dict: The response data
@@ -209,15 +661,17 @@ class BingImageSearchClient:
         Raises:
             RequestException: If all retry attempts fail
         """
+        # Enforce rate limiting
+        self._enforce_rate_limit()
+        
         last_exception = None
         
         for attempt in range(1, self.max_retries + 1):
             try:
                 logger.debug(f"Making request (attempt {attempt}/{self.max_retries})")
-                response = requests.get(
+                response = self._session.get(
                     self.endpoint,
                     params=params,
-                    headers=headers,
                     timeout=30  # 30 second timeout
                 )
                 
@@ -225,18 +679,85 @@ class BingImageSearchClient:
                 response.raise_for_status()
                 
                 # Parse JSON response
-                return response.json()
+                return orjson.loads(response.content)
                 
-            except RequestException as e:
+            except (RequestException, orjson.JSONDecodeError) as e:
                 last_exception = e
                 logger.warning(f"Request failed (attempt {attempt}/{self.max_retries}): {e}")
                 
                 if attempt < self.max_retries:
-                    # Calculate exponential backoff wait time (1s, 2s, 4s, ...)
-                    wait_time = 2 ** (attempt - 1)
-                    logger.info(f"Retrying in {wait_time} seconds...")
+                    response = getattr(e, 'response', None)
+                    if response is not None:
+                        wait_time = self._backoff_delay(
+                            attempt, response.status_code, response.headers.get('Retry-After')
+                        )
+                    else:
+                        wait_time = self._backoff_delay(attempt)
+                    logger.info(f"Retrying in {wait_time:.2f} seconds...")
                     time.sleep(wait_time)
         
         # If we get here, all retries failed
         logger.error(f"All {self.max_retries} request attempts failed")
         raise last_exception or RequestException("All retry attempts failed")
+    
+    @_cached_response
+    async def _make_request_with_retries_async(
+        self,
+        session: aiohttp.ClientSession,
+        params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Make a request to the Bing Image Search API with retries, asynchronously
+        
+        Args:
+            session: The aiohttp session to use
+            params: Request parameters
+            
+        Returns:
+            Dict: The response data
+            
+        Raises:
+            RequestException: If all retry attempts fail, wrapping the last
+                aiohttp error so callers see the same type as for search()
+        """
+        # Enforce rate limiting without blocking the event loop
+        wait_time = self._reserve_request_slot()
+        if wait_time > 0:
+            logger.debug(f"Rate limiting: Waiting {wait_time:.2f} seconds")
+            await asyncio.sleep(wait_time)
+        
+        last_exception = None
+        
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                logger.debug(f"Making request (attempt {attempt}/{self.max_retries})")
+                async with session.get(
+                    self.endpoint,
+                    params=params,
+                    timeout=aiohttp.ClientTimeout(total=30)  # 30 second timeout
+                ) as response:
+                    # Check for HTTP errors
+                    response.raise_for_status()
+                    
+                    # Parse JSON response
+                    return orjson.loads(await response.read())
+                
+            except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError) as e:
+                last_exception = e
+                logger.warning(f"Request failed (attempt {attempt}/{self.max_retries}): {e}")
+                
+                if attempt < self.max_retries:
+                    if isinstance(e, aiohttp.ClientResponseError):
+                        wait_time = self._backoff_delay(
+                            attempt, e.status, e.headers.get('Retry-After') if e.headers else None
+                        )
+                    else:
+                        wait_time = self._backoff_delay(attempt)
+                    logger.info(f"Retrying in {wait_time:.2f} seconds...")
+                    await asyncio.sleep(wait_time)
+        
+        # If we get here, all retries failed
+        logger.error(f"All {self.max_retries} request attempts failed")
+        raise RequestException(
+            f"All {self.max_retries} request attempts failed: {last_exception}"
+        ) from last_exception
@@ -2,12 +2,16 @@
 Data models for the Bing Image Search API
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-import json
+import orjson
 
-@dataclass
+from image_harvester.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+@dataclass(slots=True)
 class ImageMetadata:
     """Metadata for an image from Bing Image Search"""
     content_url: str
@@ -22,9 +26,6 @@ class ImageMetadata:
     content_type: Optional[str] = None
     accentColor: Optional[str] = None
     
-    # Raw data for any other properties not explicitly defined
-    _raw_data: Dict[str, Any] = field(default_factory=dict, repr=False)
-    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ImageMetadata':
         """
@@ -36,48 +37,40 @@ class ImageMetadata:
         Returns:
             ImageMetadata: Instance populated with the data
         """
-        # Required fields
-        content_url = data.get('contentUrl', '')
-        name = data.get('name', '')
-        width = data.get('width', 0)
-        height = data.get('height', 0)
+        # Bind the lookup once, this runs for every result of every page
+        g = data.get
         
-        # Optional fields
-        content_size = data.get('contentSize', None)
-        if content_size is not None and isinstance(content_size, str):
-            # Convert string like "1234 B" to int
-            if ' B' in content_size:
-                content_size = int(content_size.split(' B')[0])
-        
-        encoding_format = data.get('encodingFormat', None)
-        host_page_url = data.get('hostPageUrl', None)
-        thumbnail_url = data.get('thumbnailUrl', None)
+        # Convert a size string like "1234 B" to int
+        content_size = g('contentSize')
+        if isinstance(content_size, str):
+            try:
+                content_size = int(content_size.partition(' ')[0])
+            except ValueError:
+                content_size = None
         
-        # Parse date if available
+        # Parse date if available, stripping a single UTC designator
         created_date = None
-        if 'datePublished' in data:
+        date_published = g('datePublished')
+        if isinstance(date_published, str):
             try:
-                created_date = datetime.fromisoformat(data['datePublished'].rstrip('Z'))
-            except (ValueError, TypeError):
+                created_date = datetime.fromisoformat(
+                    date_published[:-1] if date_published[-1:] == 'Z' else date_published
+                )
+            except ValueError:
                 pass
         
-        content_type = data.get('contentType', None)
-        accent_color = data.get('accentColor', None)
-        
-        # Store the original data
         return cls(
-            content_url=content_url,
-            name=name,
-            width=width,
-            height=height,
+            content_url=g('contentUrl', ''),
+            name=g('name', ''),
+            width=g('width', 0),
+            height=g('height', 0),
             content_size=content_size,
-            encoding_format=encoding_format,
-            host_page_url=host_page_url,
-            thumbnail_url=thumbnail_url,
+            encoding_format=g('encodingFormat'),
+            host_page_url=g('hostPageUrl'),
+            thumbnail_url=g('thumbnailUrl'),
             created_date=created_date,
-            content_type=content_type,
-            accentColor=accent_color,
-            _raw_data=data
+            content_type=g('contentType'),
+            accentColor=g('accentColor')
         )
     
     def to_dict(self) -> Dict[str, Any]:
@@ -108,7 +101,7 @@ class ImageMetadata:
         Returns:
             str: JSON string representation of the metadata
         """
-        return json.dumps(self.to_dict(), default=str)
+        return orjson.dumps(self.to_dict(), default=str).decode()
     
     def meets_size_requirements(self, min_width: int, min_height: int) -> bool:
         """
@@ -123,7 +116,23 @@ class ImageMetadata:
         """
         return self.width >= min_width and self.height >= min_height
 
-@dataclass
+def _try_parse_image(item: Dict[str, Any]) -> Optional[ImageMetadata]:
+    """
+    Parse a single image result, returning None if it is malformed
+    
+    Args:
+        item: Dictionary containing image metadata from Bing
+        
+    Returns:
+        ImageMetadata: The parsed image, or None on failure
+    """
+    try:
+        return ImageMetadata.from_dict(item)
+    except Exception as e:
+        logger.debug(f"Error parsing image: {e}")
+        return None
+
+@dataclass(slots=True)
 class SearchResult:
     """Result of a Bing Image Search"""
     query: str
@@ -143,15 +152,12 @@ class SearchResult:
         Returns:
             SearchResult: Instance populated with the response data
         """
-        images = []
-        value = response_data.get('value', [])
+        value = response_data.get('value', ())
+        images = [image for image in map(_try_parse_image, value) if image is not None]
         
-        for item in value:
-            try:
-                image = ImageMetadata.from_dict(item)
-                images.append(image)
-            except Exception as e:
-                print(f"Error parsing image: {e}")
+        skipped = len(value) - len(images)
+        if skipped:
+            logger.warning(f"Skipped {skipped} of {len(value)} images that could not be parsed")
         
         # Get pagination information
         next_offset = None
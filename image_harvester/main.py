@@ -8,8 +8,6 @@ import sys
 from image_harvester import __version__
 from image_harvester.utils.logging import setup_logging, get_logger
 
-# Set up logging
-logger = setup_logging()
 module_logger = get_logger(__name__)
 
 def main():
@@ -17,6 +15,10 @@ def main():
     Main entry point for the application.
     Initializes the UI and starts the application.
     """
+    # Set up logging here rather than on import, so importing this module
+    # doesn't create a log file
+    setup_logging()
+    
     module_logger.info(f"Starting ImageHarvester version {__version__}")
     
     # TODO: Initialize UI and start the application
@@ -3,30 +3,57 @@ Configuration management for ImageHarvester
 """
 
 import os
+import functools
 from pathlib import Path
+from typing import NamedTuple, Optional
 from dotenv import load_dotenv
 from image_harvester.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
-# Load environment variables from .env file if it exists
-env_path = Path('.env')
-if env_path.exists():
-    logger.info(f"Loading environment from {env_path.absolute()}")
-    load_dotenv(dotenv_path=env_path)
-else:
-    logger.warning(f"No .env file found at {env_path.absolute()}, using default environment")
+class Config(NamedTuple):
+    """Application settings read from the environment"""
+    bing_search_api_key: Optional[str]
+    bing_search_endpoint: str
+    max_images_per_search: int
+    default_image_min_width: int
+    default_image_min_height: int
+    default_request_delay: float
+    max_retry_attempts: int
+    bing_cache_ttl: float
 
-# API Configuration
-BING_SEARCH_API_KEY = os.getenv('BING_SEARCH_API_KEY')
-BING_SEARCH_ENDPOINT = os.getenv('BING_SEARCH_ENDPOINT', 'https://api.bing.microsoft.com/v7.0/images/search')
-
-# Application Configuration
-MAX_IMAGES_PER_SEARCH = int(os.getenv('MAX_IMAGES_PER_SEARCH', 100))
-DEFAULT_IMAGE_MIN_WIDTH = int(os.getenv('DEFAULT_IMAGE_MIN_WIDTH', 400))
-DEFAULT_IMAGE_MIN_HEIGHT = int(os.getenv('DEFAULT_IMAGE_MIN_HEIGHT', 400))
-DEFAULT_REQUEST_DELAY = float(os.getenv('DEFAULT_REQUEST_DELAY', 1.0))
-MAX_RETRY_ATTEMPTS = int(os.getenv('MAX_RETRY_ATTEMPTS', 3))
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
+    """
+    Load the configuration from the environment
+    
+    The .env file is only parsed on the first call; later calls return the
+    same cached Config. Use get_config.cache_clear() to reload it.
+    
+    Returns:
+        Config: The application configuration
+    """
+    # Load environment variables from .env file if it exists
+    env_path = Path('.env')
+    if env_path.exists():
+        logger.info(f"Loading environment from {env_path.absolute()}")
+        load_dotenv(dotenv_path=env_path)
+    else:
+        logger.warning(f"No .env file found at {env_path.absolute()}, using default environment")
+    
+    return Config(
+        # API Configuration
+        bing_search_api_key=os.getenv('BING_SEARCH_API_KEY'),
+        bing_search_endpoint=os.getenv('BING_SEARCH_ENDPOINT', 'https://api.bing.microsoft.com/v7.0/images/search'),
+        
+        # Application Configuration
+        max_images_per_search=int(os.getenv('MAX_IMAGES_PER_SEARCH', 100)),
+        default_image_min_width=int(os.getenv('DEFAULT_IMAGE_MIN_WIDTH', 400)),
+        default_image_min_height=int(os.getenv('DEFAULT_IMAGE_MIN_HEIGHT', 400)),
+        default_request_delay=float(os.getenv('DEFAULT_REQUEST_DELAY', 1.0)),
+        max_retry_attempts=int(os.getenv('MAX_RETRY_ATTEMPTS', 3)),
+        bing_cache_ttl=float(os.getenv('BING_CACHE_TTL', 24 * 60 * 60)),
+    )
 
 def validate_config():
     """
@@ -35,11 +62,13 @@ def validate_config():
     Returns:
         bool: True if config is valid, False otherwise
     """
-    if BING_SEARCH_API_KEY is None:
+    config = get_config()
+    
+    if config.bing_search_api_key is None:
         logger.error("BING_SEARCH_API_KEY is not set in environment or .env file")
         return False
     
-    if not BING_SEARCH_ENDPOINT:
+    if not config.bing_search_endpoint:
         logger.error("BING_SEARCH_ENDPOINT is not set in environment or .env file")
         return False
     
@@ -7,6 +7,16 @@ import logging
 from datetime import datetime
 from pathlib import Path
 
+class _LazyFileHandler(logging.FileHandler):
+    """File handler that only creates its directory and file on the first record"""
+    
+    def __init__(self, filename, **kwargs):
+        super().__init__(filename, delay=True, **kwargs)
+    
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
 def setup_logging(level=logging.INFO):
     """
     Configure logging for the application
@@ -17,9 +27,8 @@ def setup_logging(level=logging.INFO):
     Returns:
         The configured logger instance
     """
-    # Create logs directory if it doesn't exist
+    # The logs directory is created on the first log record
     log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
     
     # Generate a filename based on the current date and time
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -34,7 +43,7 @@ def setup_logging(level=logging.INFO):
         logger.handlers.clear()
     
     # Create file handler
-    file_handler = logging.FileHandler(log_file)
+    file_handler = _LazyFileHandler(log_file)
     file_handler.setLevel(level)
     
     # Create console handler
@@ -52,7 +61,8 @@ def setup_logging(level=logging.INFO):
     logger.addHandler(file_handler)
     logger.addHandler(console_handler)
     
-    logger.info("Logging initialized")
+    # Nothing is logged here, so the log file only appears once there is
+    # something to put in it
     return logger
 
 def get_logger(name):
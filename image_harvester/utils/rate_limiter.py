@@ -0,0 +1,69 @@
+"""
+Rate limiting for ImageHarvester
+"""
+
+import time
+import threading
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter
+
+    Tokens refill continuously at `rate` per second up to `capacity`, so
+    short bursts are allowed while the long-term rate stays bounded.
+    Callers that find the bucket empty reserve a token anyway and are told
+    how long to wait for it, which keeps concurrent callers queued in order.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Initialize the token bucket
+
+        Args:
+            rate: Number of tokens added per second
+            capacity: Maximum number of tokens the bucket can hold
+        """
+        if rate <= 0:
+            raise ValueError("Token bucket rate must be positive")
+
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, n: int = 1) -> float:
+        """
+        Take n tokens from the bucket without blocking
+
+        Args:
+            n: Number of tokens to take
+
+        Returns:
+            float: Seconds the caller must wait before the tokens are available
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+
+            # The balance may go negative; later callers then wait for the debt too
+            self.tokens -= n
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self, n: int = 1) -> float:
+        """
+        Take n tokens from the bucket, sleeping until they are available
+
+        Args:
+            n: Number of tokens to take
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        wait_time = self.reserve(n)
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return wait_time
@@ -25,11 +25,15 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.10",
     install_requires=[
         "customtkinter>=5.2.0",
         "pillow>=9.5.0",
         "requests>=2.30.0",
+        "aiohttp>=3.8.0",
+        "orjson>=3.9",
+        "brotli>=1.0.9",
+        "diskcache>=5.6.0",
         "python-dotenv>=1.0.0",
         "tqdm>=4.65.0",
     ],
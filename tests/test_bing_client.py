@@ -0,0 +1,380 @@
+"""
+Test pagination in the Bing Image Search client
+"""
+
+import aiohttp
+import orjson
+import pytest
+from requests.exceptions import RequestException
+from image_harvester.api import bing_client
+from image_harvester.api.bing_client import BingImageSearchClient
+
+TOTAL = 600
+
+def image(i):
+    """
+    Build a Bing image result for the i-th match.
+    """
+    return {'contentUrl': f'http://example.com/{i}.jpg', 'name': str(i), 'width': 800, 'height': 600}
+
+def urls(indices):
+    """
+    The content URLs of the given matches.
+    """
+    return [f'http://example.com/{i}.jpg' for i in indices]
+
+def fake_page(params):
+    """
+    Build a Bing response for the requested page.
+
+    The page at offset 150 repeats the last image of the first page, and the
+    page at offset 300 returns a nextOffset that doesn't move forward.
+    """
+    offset = int(params['offset'])
+    count = int(params['count'])
+
+    indices = list(range(offset, min(offset + count, TOTAL)))
+    if offset == 150:
+        indices = [149] + indices[:-1]
+
+    return {
+        'value': [image(i) for i in indices],
+        'nextOffset': offset if offset == 300 else offset + count,
+        'totalEstimatedMatches': TOTAL,
+    }
+
+def fake_short_page(params):
+    """
+    Build a response from a server that returns fewer results than requested.
+
+    Out of 10000 matches, pages hold at most 100 images below offset 300 and
+    at most 80 from there on, so the page size changes in the middle of a
+    batch.
+    """
+    offset = int(params['offset'])
+    size = min(int(params['count']), 100 if offset < 300 else 80)
+
+    return {
+        'value': [image(i) for i in range(offset, offset + size)],
+        'nextOffset': offset + size,
+        'totalEstimatedMatches': 10000,
+    }
+
+class FakeResponse:
+    """Response stub for both the requests and the aiohttp session"""
+
+    def __init__(self, response_data):
+        self.content = orjson.dumps(response_data)
+        self.status_code = 200
+        self.headers = {}
+
+    def raise_for_status(self):
+        pass
+
+    async def read(self):
+        return self.content
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+class FakeClientSession:
+    """Stand-in for aiohttp.ClientSession"""
+
+    page = staticmethod(fake_page)
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def get(self, url, params=None, **kwargs):
+        return FakeResponse(self.page(params))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+def fake_skipping_page(params):
+    """
+    Build a response whose nextOffset skips 5 results past the page.
+
+    Bing does this when it filters out results server-side, so only offsets
+    taken from nextOffset line up with the real result order.
+    """
+    offset = int(params['offset'])
+    size = min(int(params['count']), 100)
+
+    return {
+        'value': [image(i) for i in range(offset, offset + size)],
+        'nextOffset': offset + size + 5,
+        'totalEstimatedMatches': 10000,
+    }
+
+def skipping_urls(max_images):
+    """
+    The images reachable by following the nextOffset of fake_skipping_page.
+    """
+    indices = []
+    offset = 0
+    while len(indices) < max_images:
+        indices.extend(range(offset, offset + 100))
+        offset += 105
+    return urls(indices[:max_images])
+
+def make_client(monkeypatch, page):
+    """
+    Create a client whose requests and aiohttp sessions answer with `page`.
+    """
+    monkeypatch.setattr(bing_client.aiohttp, 'ClientSession', FakeClientSession)
+    monkeypatch.setattr(bing_client.aiohttp, 'TCPConnector', lambda **kwargs: None)
+    monkeypatch.setattr(FakeClientSession, 'page', staticmethod(page))
+
+    client = BingImageSearchClient(api_key='test-key', request_delay=0, cache_ttl=0)
+    monkeypatch.setattr(
+        client._session, 'get', lambda url, params=None, **kwargs: FakeResponse(page(params))
+    )
+    return client
+
+@pytest.fixture
+def client(monkeypatch):
+    """
+    Create a client whose sessions return full pages with a duplicate and a stall.
+    """
+    client = make_client(monkeypatch, fake_page)
+    yield client
+    client.close()
+
+@pytest.fixture
+def skipping_client(monkeypatch):
+    """
+    Create a client whose sessions return a nextOffset past the end of each page.
+    """
+    client = make_client(monkeypatch, fake_skipping_page)
+    yield client
+    client.close()
+
+@pytest.fixture
+def short_page_client(monkeypatch):
+    """
+    Create a client whose sessions return fewer results than requested.
+    """
+    client = make_client(monkeypatch, fake_short_page)
+    yield client
+    client.close()
+
+def expected_urls():
+    """
+    The unique images before the cursor stalls, in result order.
+    """
+    return urls(i for i in range(450) if i != 299)
+
+def test_search_all_stops_at_stalled_cursor_and_skips_duplicates(client):
+    """
+    Test that search_all() drops repeated URLs and ignores pages after a stall.
+    """
+    result = client.search_all('cats', max_images=TOTAL)
+
+    assert [img.content_url for img in result.images] == expected_urls()
+    assert result.total_estimated_matches == TOTAL
+
+def test_iter_search_stops_at_stalled_cursor_and_skips_duplicates(client):
+    """
+    Test that iter_search() drops repeated URLs and stops once the cursor stalls.
+    """
+    images = list(client.iter_search('cats', max_images=TOTAL))
+
+    assert [img.content_url for img in images] == expected_urls()
+
+def test_iter_search_respects_max_images(client):
+    """
+    Test that iter_search() yields no more than max_images.
+    """
+    images = list(client.iter_search('cats', max_images=160))
+
+    assert len(images) == 160
+    assert len({img.content_url for img in images}) == 160
+
+def test_search_all_follows_cursor_on_short_pages(short_page_client):
+    """
+    Test that search_all() doesn't skip results when pages are shorter than requested.
+    """
+    result = short_page_client.search_all('cats', max_images=600)
+
+    assert [img.content_url for img in result.images] == urls(range(600))
+
+def test_iter_search_follows_cursor_on_short_pages(short_page_client):
+    """
+    Test that iter_search() doesn't skip results when pages are shorter than requested.
+    """
+    images = list(short_page_client.iter_search('cats', max_images=600))
+
+    assert [img.content_url for img in images] == urls(range(600))
+
+@pytest.fixture
+def cached_client_factory(monkeypatch, tmp_path):
+    """
+    Create clients with a disk cache in a temporary directory, counting requests.
+    """
+    monkeypatch.setattr(bing_client, 'CACHE_DIR', str(tmp_path))
+    calls = []
+    clients = []
+
+    def make(api_key='test-key'):
+        client = BingImageSearchClient(api_key=api_key, request_delay=0, cache_ttl=60)
+
+        def get(url, params=None, **kwargs):
+            calls.append(params)
+            return FakeResponse(fake_page(params))
+
+        monkeypatch.setattr(client._session, 'get', get)
+        clients.append(client)
+        return client
+
+    yield make, calls
+    for client in clients:
+        client.close()
+
+def test_cached_response_skips_request(cached_client_factory):
+    """
+    Test that a repeated search is answered from the cache.
+    """
+    make, calls = cached_client_factory
+    client = make()
+
+    first = client.search('cats', count=10)
+    second = client.search('cats', count=10)
+
+    assert len(calls) == 1
+    assert second.images == first.images
+
+def test_cache_is_not_shared_between_api_keys(cached_client_factory):
+    """
+    Test that clients with different API keys don't share cached responses.
+    """
+    make, calls = cached_client_factory
+
+    make('first-key').search('cats', count=10)
+    make('second-key').search('cats', count=10)
+
+    assert len(calls) == 2
+
+def test_cache_is_opened_on_first_use(monkeypatch, tmp_path):
+    """
+    Test that constructing a client doesn't create the cache directory.
+    """
+    cache_dir = tmp_path / 'cache'
+    monkeypatch.setattr(bing_client, 'CACHE_DIR', str(cache_dir))
+
+    client = BingImageSearchClient(api_key='test-key', request_delay=0, cache_ttl=60)
+    assert not cache_dir.exists()
+
+    monkeypatch.setattr(
+        client._session, 'get', lambda url, params=None, **kwargs: FakeResponse(fake_page(params))
+    )
+    client.search('cats', count=10)
+    client.close()
+    assert cache_dir.exists()
+
+def test_unwritable_cache_dir_disables_cache(monkeypatch, tmp_path, caplog):
+    """
+    Test that a cache directory that can't be created only disables caching.
+    """
+    blocker = tmp_path / 'not-a-dir'
+    blocker.write_text('')
+    monkeypatch.setattr(bing_client, 'CACHE_DIR', str(blocker / 'cache'))
+    calls = []
+
+    def get(url, params=None, **kwargs):
+        calls.append(params)
+        return FakeResponse(fake_page(params))
+
+    client = BingImageSearchClient(api_key='test-key', request_delay=0, cache_ttl=60)
+    monkeypatch.setattr(client._session, 'get', get)
+
+    first = client.search('cats', count=10)
+    second = client.search('cats', count=10)
+    client.close()
+
+    assert len(first.images) == 10
+    assert second.images == first.images
+    assert len(calls) == 2
+    assert 'caching disabled' in caplog.text
+
+def test_search_all_starts_every_page_at_server_cursor(skipping_client):
+    """
+    Test that every page after the first starts at a nextOffset the server returned.
+    """
+    result = skipping_client.search_all('cats', max_images=600)
+
+    assert [img.content_url for img in result.images] == skipping_urls(600)
+
+def test_iter_search_starts_every_page_at_server_cursor(skipping_client):
+    """
+    Test that iter_search() follows the server cursor past skipped results.
+    """
+    images = list(skipping_client.iter_search('cats', max_images=600))
+
+    assert [img.content_url for img in images] == skipping_urls(600)
+
+def test_search_all_raises_request_exception_for_later_pages(monkeypatch):
+    """
+    Test that a failing page after the first raises RequestException, like page 1.
+    """
+    client = make_client(monkeypatch, fake_short_page)
+    client.max_retries = 1
+
+    def failing_get(self, url, params=None, **kwargs):
+        raise aiohttp.ClientConnectionError("Connection reset")
+
+    monkeypatch.setattr(FakeClientSession, 'get', failing_get)
+
+    with pytest.raises(RequestException):
+        client.search_all('cats', max_images=300)
+    client.close()
+
+def test_disabled_cache_stays_on_event_loop(client, monkeypatch):
+    """
+    Test that async page fetches don't hop to worker threads when caching is off.
+    """
+    def fail_to_thread(*args, **kwargs):
+        raise AssertionError("asyncio.to_thread() called with caching disabled")
+
+    monkeypatch.setattr(bing_client.asyncio, 'to_thread', fail_to_thread)
+
+    result = client.search_all('cats', max_images=TOTAL)
+
+    assert [img.content_url for img in result.images] == expected_urls()
+
+@pytest.fixture
+def max_jitter(monkeypatch):
+    """
+    Make the backoff jitter always pick the top of its range.
+    """
+    monkeypatch.setattr(bing_client.random, 'uniform', lambda low, high: high)
+
+def test_backoff_delay_uses_full_jitter_up_to_cap(client, max_jitter, monkeypatch):
+    """
+    Test that backoff delays lie between 0 and an exponential cap of at most 30s.
+    """
+    assert [client._backoff_delay(attempt) for attempt in range(1, 8)] == [1, 2, 4, 8, 16, 30, 30]
+
+    monkeypatch.setattr(bing_client.random, 'uniform', lambda low, high: low)
+    assert [client._backoff_delay(attempt) for attempt in range(1, 8)] == [0] * 7
+
+def test_backoff_delay_honours_retry_after(client, max_jitter):
+    """
+    Test that a 429 waits for Retry-After plus up to a second, or the cap without one.
+    """
+    assert client._backoff_delay(1, status_code=429, retry_after='5') == 6
+    assert client._backoff_delay(3, status_code=429) == 5
+    assert client._backoff_delay(3, status_code=429, retry_after='Wed, 21 Oct 2015 07:28:00 GMT') == 5
+
+def test_backoff_delay_clamps_retry_after(client, max_jitter):
+    """
+    Test that an oversized or negative Retry-After is clamped.
+    """
+    assert client._backoff_delay(1, status_code=429, retry_after='3600') == bing_client.MAX_RETRY_AFTER + 1
+    assert client._backoff_delay(1, status_code=429, retry_after='-5') == 1
@@ -0,0 +1,36 @@
+"""
+Test the logging configuration
+"""
+
+import logging
+
+import pytest
+from image_harvester.utils.logging import setup_logging, get_logger
+
+@pytest.fixture
+def logger(monkeypatch, tmp_path):
+    """
+    Set up logging in a temporary working directory, removing the handlers afterwards.
+    """
+    monkeypatch.chdir(tmp_path)
+    logger = setup_logging(logging.DEBUG)
+    yield logger
+    for handler in logger.handlers:
+        handler.close()
+    logger.handlers.clear()
+
+def test_setup_logging_creates_no_file(logger, tmp_path):
+    """
+    Test that setup_logging() doesn't create the logs directory or a log file.
+    """
+    assert not (tmp_path / 'logs').exists()
+
+def test_log_file_created_on_first_record(logger, tmp_path):
+    """
+    Test that the log file is created and written when the first record is logged.
+    """
+    get_logger('tests').info("Starting work")
+
+    log_files = list((tmp_path / 'logs').iterdir())
+    assert len(log_files) == 1
+    assert "Starting work" in log_files[0].read_text()
@@ -0,0 +1,107 @@
+"""
+Test the Bing Image Search data models
+"""
+
+from datetime import datetime
+
+from image_harvester.api.models import ImageMetadata, SearchResult
+
+def make_result():
+    """
+    Build a search result with one small and one large image.
+    """
+    return SearchResult(
+        query='cats',
+        images=[
+            ImageMetadata(content_url='http://example.com/a.jpg', name='a', width=100, height=100),
+            ImageMetadata(content_url='http://example.com/b.jpg', name='b', width=1000, height=1000),
+        ]
+    )
+
+def names(result):
+    """
+    The names of the images in a search result.
+    """
+    return [img.name for img in result.images]
+
+def test_filter_by_size():
+    """
+    Test that filter_by_size() keeps only images meeting both minimums.
+    """
+    assert names(make_result().filter_by_size(500, 500)) == ['b']
+    assert names(make_result().filter_by_size(100, 1000)) == ['b']
+    assert names(make_result().filter_by_size(0, 0)) == ['a', 'b']
+
+def test_filter_by_size_sees_in_place_changes():
+    """
+    Test that filter_by_size() reflects changes made to the images after a filter.
+    """
+    result = make_result()
+    assert names(result.filter_by_size(500, 500)) == ['b']
+
+    result.images.reverse()
+    assert names(result.filter_by_size(500, 500)) == ['b']
+
+    result.images[0] = ImageMetadata(content_url='http://example.com/c.jpg', name='c', width=800, height=800)
+    assert names(result.filter_by_size(500, 500)) == ['c']
+
+    result.images[1].width = 900
+    result.images[1].height = 900
+    assert names(result.filter_by_size(500, 500)) == ['c', 'a']
+
+def test_to_dict():
+    """
+    Test that to_dict() exports every field in order, with the date as ISO text.
+    """
+    image = ImageMetadata.from_dict({
+        'contentUrl': 'http://example.com/a.jpg',
+        'name': 'a',
+        'width': 800,
+        'height': 600,
+        'contentSize': '1234 B',
+        'datePublished': '2020-01-02T03:04:05Z',
+        'accentColor': 'FFFFFF',
+    })
+
+    expected = {
+        'content_url': 'http://example.com/a.jpg',
+        'name': 'a',
+        'width': 800,
+        'height': 600,
+        'content_size': 1234,
+        'encoding_format': None,
+        'host_page_url': None,
+        'thumbnail_url': None,
+        'created_date': '2020-01-02T03:04:05',
+        'content_type': None,
+        'accent_color': 'FFFFFF',
+    }
+    assert image.to_dict() == expected
+    assert list(image.to_dict()) == list(expected)
+
+def test_from_dict_parses_date_published():
+    """
+    Test that datePublished is parsed, and missing or invalid values become None.
+    """
+    def created_date(value):
+        return ImageMetadata.from_dict({'datePublished': value}).created_date
+
+    assert created_date('2020-01-02T03:04:05Z') == datetime(2020, 1, 2, 3, 4, 5)
+    assert created_date('2020-01-02T03:04:05') == datetime(2020, 1, 2, 3, 4, 5)
+    assert created_date('yesterday') is None
+    assert created_date(20200102) is None
+    assert created_date(None) is None
+
+def test_from_dict_parses_content_size():
+    """
+    Test that contentSize strings are converted to int, and malformed ones to None.
+    """
+    def content_size(value):
+        return ImageMetadata.from_dict({'contentSize': value}).content_size
+
+    assert content_size('1234 B') == 1234
+    assert content_size('1234') == 1234
+    assert content_size(1234) == 1234
+    assert content_size('1,234 B') is None
+    assert content_size('unknown') is None
+    assert content_size(None) is None
@@ -0,0 +1,87 @@
+"""
+Test the token bucket rate limiter
+"""
+
+import threading
+
+import pytest
+from image_harvester.utils import rate_limiter
+from image_harvester.utils.rate_limiter import TokenBucket
+
+@pytest.fixture
+def clock(monkeypatch):
+    """
+    Replace time.monotonic in the rate limiter with a manually advanced clock.
+    """
+    now = [100.0]
+    monkeypatch.setattr(rate_limiter.time, 'monotonic', lambda: now[0])
+    return now
+
+def test_burst_up_to_capacity(clock):
+    """
+    Test that a full bucket serves `capacity` requests without waiting.
+    """
+    bucket = TokenBucket(rate=2.0, capacity=3)
+
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() > 0
+
+def test_wait_time_when_empty(clock):
+    """
+    Test that an empty bucket reports the time until the next token and refills.
+    """
+    bucket = TokenBucket(rate=2.0, capacity=1)
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.5)
+
+    # The second reservation left a debt of one token, paid off after 0.5s
+    clock[0] += 0.5
+    assert bucket.reserve() == pytest.approx(0.5)
+
+    # A long idle period refills the bucket, but never above capacity
+    clock[0] += 10.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.5)
+
+def test_concurrent_reservations_queue(clock):
+    """
+    Test that concurrent callers on an empty bucket each get their own slot.
+    """
+    bucket = TokenBucket(rate=4.0, capacity=1)
+    bucket.reserve()
+
+    waits = []
+    lock = threading.Lock()
+
+    def reserve():
+        wait_time = bucket.reserve()
+        with lock:
+            waits.append(wait_time)
+
+    threads = [threading.Thread(target=reserve) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(waits) == pytest.approx([0.25 * i for i in range(1, 9)])
+
+def test_acquire_sleeps_for_reserved_wait(clock, monkeypatch):
+    """
+    Test that acquire() sleeps for the wait returned by reserve().
+    """
+    slept = []
+    monkeypatch.setattr(rate_limiter.time, 'sleep', slept.append)
+    bucket = TokenBucket(rate=2.0, capacity=1)
+
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert slept == [pytest.approx(0.5)]
+
+def test_rate_must_be_positive():
+    """
+    Test that a non-positive rate is rejected.
+    """
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0, capacity=1)